@@ -0,0 +1,72 @@
+"""
+Animates how the landing probabilities spread around the board over
+successive turns, starting with everyone on 'Go'. Chaining a turn onto a
+board-wide distribution is a single matrix-vector multiply against the
+stacked per-square distributions from `probabilities.py`.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.animation import FuncAnimation
+
+from constants import SQUARE_NAMES
+from probabilities import _unit_landing
+
+# Row i of M_BOARD is the turn-ending distribution for a
+# turn that starts on square i, and likewise for M_JAIL
+M_BOARD = np.stack([_unit_landing(i, 0)[0] for i in range(36)])
+M_JAIL = np.stack([_unit_landing(i, 0)[1] for i in range(36)])
+
+
+def chain_landing_probabilities(board_probabilities):
+    """
+    Return `(board, jail)` one turn after the board-wide distribution
+    `board_probabilities`, as a single matrix-vector multiply.
+    """
+    return board_probabilities @ M_BOARD, board_probabilities @ M_JAIL
+
+
+if __name__ == "__main__":
+    fig = plt.figure(figsize=(14, 6))
+
+    # Everyone starts on 'Go'
+    board = np.zeros(36)
+    board[0] = 1
+    board, jail = chain_landing_probabilities(board)
+
+    # Percentage buffers allocated once and
+    # rewritten in place on every frame
+    board_percent = np.empty(36)
+    jail_percent = np.empty(36)
+    np.multiply(board, 100, out=board_percent)
+    np.multiply(jail, 100, out=jail_percent)
+
+    # The bar artists are created once and only
+    # restyled per frame, never re-created
+    bars_board = plt.bar(SQUARE_NAMES, board_percent, color="blue")
+    bars_jail = plt.bar(SQUARE_NAMES, jail_percent, bottom=board_percent, color="orange")
+
+    plt.ylabel("Probability of ending a turn here (%)")
+    plt.xticks(rotation=90)
+    plt.tight_layout()
+
+    def update(turn):
+        """Advance the distribution by a turn and restyle the bars in place."""
+        global board
+
+        # The first frame is the state the bars were created with
+        if turn == 0:
+            return
+
+        board, jail = chain_landing_probabilities(board)
+        np.multiply(board, 100, out=board_percent)
+        np.multiply(jail, 100, out=jail_percent)
+
+        for bar, height in zip(bars_board, board_percent):
+            bar.set_height(height)
+        for bar, height, bottom in zip(bars_jail, jail_percent, board_percent):
+            bar.set_height(height)
+            bar.set_y(bottom)
+
+    animation = FuncAnimation(fig, update, frames=11, interval=500)
+    animation.save("chained_landing_probabilities.gif", writer="pillow")
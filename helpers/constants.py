@@ -0,0 +1,46 @@
+"""
+Constants shared by the probability helper scripts.
+"""
+
+SQUARE_NAMES = [
+    "Go",
+    "Old Kent Road",
+    "Chance",
+    "Whitechapel Road",
+    "Chance",
+    "The Angel, Islington",
+    "Euston Road",
+    "Location",
+    "Pentonville Road",
+    "Jail",
+    "Pall Mall",
+    "Chance",
+    "Whitehall",
+    "Northumberland Avenue",
+    "Bow Street",
+    "Marlborough Street",
+    "Location",
+    "Vine Street",
+    "Free Parking",
+    "Strand",
+    "Chance",
+    "Fleet Street",
+    "Trafalgar Square",
+    "Leicester Square",
+    "Coventry Street",
+    "Location",
+    "Piccadilly",
+    "Go to Jail",
+    "Regent Street",
+    "Chance",
+    "Oxford Street",
+    "Bond Street",
+    "Chance",
+    "Park Lane",
+    "Location",
+    "Mayfair",
+]
+
+# Positions of 'Go to jail' and 'Jail' on the game board
+GO_TO_JAIL = 27
+JAIL = 9
@@ -0,0 +1,78 @@
+"""
+Computes the probability of a turn ending in jail from every starting
+square. The doubles-chain rules form a tiny absorbing Markov chain over
+the 36x3 (square, doubles-rolled) states with jail as the absorbing
+state, so all 108 probabilities come out of one linear solve.
+"""
+
+import functools
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from constants import SQUARE_NAMES
+from probabilities import J_DOUBLE, J_NORMAL, T_DOUBLE
+
+_CACHE_FILE = os.path.join(os.path.dirname(__file__), "cache", "jail_vec.npy")
+
+if os.path.exists(_CACHE_FILE):
+    jail_vec = np.load(_CACHE_FILE)
+else:
+    # Q[s, t] is the probability of moving from transient state s to
+    # transient state t within a turn, and r[s] is the probability of
+    # going straight to jail from state s in a single roll. State
+    # (square, doubles-rolled) is indexed as doubles * 36 + square.
+    Q = np.zeros((108, 108))
+    r = np.zeros(108)
+
+    for _d in range(3):
+        _rows = slice(_d * 36, (_d + 1) * 36)
+
+        # Any roll that lands on 'Go to jail' is absorbed straight into jail
+        r[_rows] = J_NORMAL + J_DOUBLE
+
+        if _d == 2:
+            # On the third roll, any double at all also means jail
+            r[_rows] += T_DOUBLE.sum(axis=1)
+        else:
+            # Other doubles keep the turn going with one more double rolled
+            Q[_rows, (_d + 1) * 36 : (_d + 2) * 36] = T_DOUBLE
+
+    # The jail probability x of every transient state satisfies x = r + Qx
+    jail_vec = np.linalg.solve(np.eye(108) - Q, r)
+
+    os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+    np.save(_CACHE_FILE, jail_vec)
+
+
+@functools.cache
+def _unit_jail(starting_location, doubles_rolled):
+    """
+    Return the jail probability of the (starting_location,
+    doubles_rolled) state for a unit starting probability. Only 108
+    states exist, so every evaluation after the first is a hash lookup.
+    """
+    return jail_vec[doubles_rolled * 36 + starting_location]
+
+
+def jail_probability(starting_location=0, starting_roll_probability=1, doubles_rolled=0):
+    """
+    Return the probability that a turn starting on `starting_location`
+    with `doubles_rolled` doubles already rolled ends with the player
+    in jail.
+    """
+    # The starting probability is just a linear scale on the unit result
+    return starting_roll_probability * _unit_jail(starting_location, doubles_rolled)
+
+
+if __name__ == "__main__":
+    jail_percent = 100 * np.array([jail_probability(starting_location=i) for i in range(36)])
+
+    plt.figure(figsize=(14, 6))
+    plt.bar(SQUARE_NAMES, jail_percent, color="orange")
+    plt.ylabel("Probability of ending a turn in jail (%)")
+    plt.title("Jail probabilities by starting square")
+    plt.xticks(rotation=90)
+    plt.tight_layout()
+    plt.show()
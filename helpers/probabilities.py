@@ -0,0 +1,143 @@
+"""
+Computes the probability of a player ending their turn on each square of
+the board. A turn is up to three dice rolls: rolling a double grants
+another roll, and a third consecutive double sends you straight to jail,
+as does landing on the 'Go to jail' square.
+
+The distribution is computed by composing precomputed 36x36 single-roll
+transition matrices instead of recursing over every dice combination.
+`reference.py` holds the recursive formulation that these matrices are
+validated against.
+"""
+
+import functools
+import os
+from fractions import Fraction
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from constants import GO_TO_JAIL, JAIL, SQUARE_NAMES
+
+
+def _build_transitions():
+    """
+    Build the single-roll transition matrices and their three-roll
+    compositions. Everything is built and composed in exact rationals so
+    no rounding accumulates, then collapsed to float64 in a single cast.
+    """
+    # The possible sums of two dice and the probability of rolling each one
+    sums = np.arange(2, 13)
+    p_sums = np.array([Fraction(n, 36) for n in (1, 2, 3, 4, 5, 6, 5, 4, 3, 2, 1)], dtype=object)
+    # Doubles always sum to an even number, and every
+    # even sum can be made by exactly one double
+    double_sums = np.arange(2, 13, 2)
+    p_double = Fraction(1, 36)
+    p_normal = np.array([p - p_double if s % 2 == 0 else p for s, p in zip(sums, p_sums)], dtype=object)
+
+    # t_normal[i, j] is the probability of a single non-double roll
+    # moving a player from square i to square j, with the mass that
+    # would land on 'Go to jail' redirected into j_normal[i]. t_double
+    # and j_double are the same for doubles.
+    t_normal = np.zeros((36, 36), dtype=object)
+    t_double = np.zeros((36, 36), dtype=object)
+
+    starts = np.arange(36)[:, np.newaxis]
+    np.add.at(t_normal, (starts, (starts + sums) % 36), p_normal)
+    np.add.at(t_double, (starts, (starts + double_sums) % 36), p_double)
+
+    j_normal = t_normal[:, GO_TO_JAIL].copy()
+    j_double = t_double[:, GO_TO_JAIL].copy()
+    t_normal[:, GO_TO_JAIL] = 0
+    t_double[:, GO_TO_JAIL] = 0
+
+    # Fill the doubles states from the third roll backwards so each one
+    # is computed exactly once: a non-double ends the turn where it
+    # lands, a double hands the distribution to the next roll, and on
+    # the third roll any double at all means jail.
+    board_mats = np.empty((3, 36, 36), dtype=object)
+    jail_vecs = np.empty((3, 36), dtype=object)
+
+    board_mats[2] = t_normal
+    jail_vecs[2] = j_normal + j_double + t_double.sum(axis=1)
+
+    # np.matmul can't handle object arrays, hence .dot()
+    for d in (1, 0):
+        board_mats[d] = t_normal + t_double.dot(board_mats[d + 1])
+        jail_vecs[d] = j_normal + j_double + t_double.dot(jail_vecs[d + 1])
+
+    # The single exact-to-float cast for all the numerical code downstream
+    return {
+        "T_NORMAL": t_normal.astype(np.float64),
+        "T_DOUBLE": t_double.astype(np.float64),
+        "J_NORMAL": j_normal.astype(np.float64),
+        "J_DOUBLE": j_double.astype(np.float64),
+        "BOARD_MATS": board_mats.astype(np.float64),
+        "JAIL_VECS": jail_vecs.astype(np.float64),
+    }
+
+
+# The matrices only depend on the board layout, so they're cached to
+# disk and re-runs of the scripts skip straight to plotting
+_CACHE_FILE = os.path.join(os.path.dirname(__file__), "cache", "transitions.npz")
+
+if os.path.exists(_CACHE_FILE):
+    _transitions = dict(np.load(_CACHE_FILE))
+else:
+    _transitions = _build_transitions()
+    os.makedirs(os.path.dirname(_CACHE_FILE), exist_ok=True)
+    np.savez(_CACHE_FILE, **_transitions)
+
+# T_NORMAL[i, j] is the probability of a single non-double roll moving a
+# player from square i to square j, with the mass that would land on
+# 'Go to jail' redirected into J_NORMAL[i]. T_DOUBLE and J_DOUBLE are
+# the same for doubles. BOARD_MATS[d, i, j] is the probability that a
+# turn starting on square i with d doubles already rolled ends on square
+# j, and JAIL_VECS[d, i] is the probability that it ends in jail.
+T_NORMAL = _transitions["T_NORMAL"]
+T_DOUBLE = _transitions["T_DOUBLE"]
+J_NORMAL = _transitions["J_NORMAL"]
+J_DOUBLE = _transitions["J_DOUBLE"]
+BOARD_MATS = _transitions["BOARD_MATS"]
+JAIL_VECS = _transitions["JAIL_VECS"]
+
+
+@functools.lru_cache(maxsize=128)
+def _unit_landing(starting_location, doubles_rolled):
+    """
+    Return `(board, jail)` as in `landing_probabilities`, for a starting
+    roll probability of 1. Just indexes the matrices composed at import.
+    """
+    jail_board = np.zeros(36)
+    jail_board[JAIL] = JAIL_VECS[doubles_rolled][starting_location]
+
+    return BOARD_MATS[doubles_rolled][starting_location], jail_board
+
+
+def landing_probabilities(starting_location=0, starting_roll_probability=1, doubles_rolled=0):
+    """
+    Return `(board, jail)`, where `board[i]` is the probability of the
+    player's turn ending on square `i` and `jail[i]` is the probability
+    of the turn ending with the player in jail (all of which sits on the
+    'Jail' square). The two arrays sum to `starting_roll_probability`.
+    """
+    board, jail = _unit_landing(starting_location, doubles_rolled)
+
+    # Scaling allocates fresh arrays, so cached
+    # results can't be mutated through the return values
+    return starting_roll_probability * board, starting_roll_probability * jail
+
+
+if __name__ == "__main__":
+    board, jail = landing_probabilities()
+    board *= 100
+    jail *= 100
+
+    plt.figure(figsize=(14, 6))
+    plt.bar(SQUARE_NAMES, board, color="blue")
+    plt.bar(SQUARE_NAMES, jail, bottom=board, color="orange")
+    plt.ylabel("Probability of ending a turn here (%)")
+    plt.title("Landing probabilities after one turn from 'Go'")
+    plt.xticks(rotation=90)
+    plt.tight_layout()
+    plt.show()
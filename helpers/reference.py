@@ -0,0 +1,101 @@
+"""
+The recursive formulation of the turn-ending probabilities, kept as a
+slow-but-obviously-correct cross-check for the transition matrices in
+`probabilities.py`. Run this file directly to compare the two.
+"""
+
+import numpy as np
+
+from constants import GO_TO_JAIL, JAIL
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the recursion just runs interpreted
+    def njit(func=None, **kwargs):
+        if func is None:
+            return lambda f: f
+        return func
+
+
+# The sum of every dice combination, and which combinations are doubles
+DICE_SUMS = np.add.outer(np.arange(1, 7), np.arange(1, 7)).ravel()
+DOUBLES_MASK = np.eye(6, dtype=np.bool_).ravel()
+
+
+@njit(cache=True)
+def _landing(starting_location, roll_probability, doubles_rolled, board_out, jail_out):
+    """
+    Accumulate the turn-ending probabilities into the caller-provided
+    `board_out` and `jail_out` arrays, recursing over all 36 dice
+    combinations at once via the precomputed offset table.
+    """
+    # Every dice combination is equally likely
+    probability = roll_probability / 36.0
+
+    locations = (starting_location + DICE_SUMS) % 36
+    jail_mask = locations == GO_TO_JAIL
+
+    # Any roll that lands on 'Go to jail' sends the player to jail
+    jail_out[JAIL] += jail_mask.sum() * probability
+
+    # Non-double rolls end the turn wherever they land
+    normal_locations = locations[~DOUBLES_MASK & ~jail_mask]
+    board_out += np.bincount(normal_locations, minlength=36) * probability
+
+    double_locations = locations[DOUBLES_MASK & ~jail_mask]
+    if doubles_rolled == 2:
+        # A third consecutive double sends the player to jail
+        jail_out[JAIL] += len(double_locations) * probability
+    else:
+        for new_location in double_locations:
+            # The player rolls again from the new square
+            _landing(new_location, probability, doubles_rolled + 1, board_out, jail_out)
+
+
+def landing_probabilities(
+    starting_location=0,
+    starting_roll_probability=1,
+    doubles_rolled=0,
+    board_out=None,
+    jail_out=None,
+):
+    """
+    Return `(board, jail)`, where `board[i]` is the probability of the
+    player's turn ending on square `i` and `jail[i]` is the probability
+    of the turn ending with the player in jail (all of which sits on the
+    'Jail' square). The accumulator arrays are shared by the whole
+    recursion; pass `board_out` and `jail_out` to reuse your own buffers
+    across calls instead of allocating fresh ones.
+    """
+    if board_out is None:
+        board_out = np.zeros(36)
+    else:
+        board_out.fill(0)
+
+    if jail_out is None:
+        jail_out = np.zeros(36)
+    else:
+        jail_out.fill(0)
+
+    # The float() keeps Numba to a single compiled specialization
+    _landing(starting_location, float(starting_roll_probability), doubles_rolled, board_out, jail_out)
+
+    return board_out, jail_out
+
+
+if __name__ == "__main__":
+    import probabilities
+
+    # One pair of accumulator buffers serves all 108 comparisons
+    ref_board = np.zeros(36)
+    ref_jail = np.zeros(36)
+
+    for start in range(36):
+        for doubles in range(3):
+            board, jail = probabilities.landing_probabilities(start, 1, doubles)
+            landing_probabilities(start, 1, doubles, board_out=ref_board, jail_out=ref_jail)
+            assert np.allclose(board, ref_board)
+            assert np.allclose(jail, ref_jail)
+
+    print("transition matrices match the recursive formulation")